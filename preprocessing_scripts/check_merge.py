@@ -1,6 +1,8 @@
 import pandas as pd
 
-df = pd.read_csv('export_lgs_omc_2025_12_16.csv')
+# Only the columns inspected below are needed from the (wide) export file
+columns = ['lead_id', 'company_name', 'service', 'address', 'city', 'state', 'postal_code']
+df = pd.read_csv('export_lgs_omc_2025_12_16.csv', usecols=columns)
 print(f'Total rows: {len(df)}')
 print(f'Rows with company_name filled: {df["company_name"].notna().sum()}')
 print(f'Rows with service filled: {df["service"].notna().sum()}')
@@ -1,3 +1,4 @@
+import os
 import pandas as pd
 import sys
 
@@ -123,17 +124,11 @@ def filter_by_lead_ids():
                 print(f"Will update existing columns: {', '.join(existing_columns[:5])}...")
                 new_columns = existing_columns
         
-        # Create a dictionary mapping lead_id to row data for faster lookup
-        # This ensures one-to-one mapping
-        lead_id_to_data = {}
-        for idx, row in df_combined.iterrows():
-            lid = int(row['lead_id'])
-            if lid not in lead_id_to_data:
-                lead_id_to_data[lid] = {}
-                for col in source_columns:
-                    lead_id_to_data[lid][col] = row[col]
+        # Index the source rows by lead_id for a vectorized lookup
+        # (lead_ids are unique after deduplication, so this is a one-to-one mapping)
+        source_by_lead_id = df_combined.set_index('lead_id')[source_columns]
         
-        print(f"Created mapping for {len(lead_id_to_data)} unique lead_ids")
+        print(f"Created mapping for {len(source_by_lead_id)} unique lead_ids")
         
         # Initialize new columns in export dataframe with None (use object dtype to avoid dtype conflicts)
         for col in source_columns:
@@ -144,20 +139,13 @@ def filter_by_lead_ids():
                 if df_export[col].dtype != 'object':
                     df_export[col] = df_export[col].astype('object')
         
-        # Merge data by updating rows where lead_id matches
-        matched_count = 0
-        for idx, row in df_export.iterrows():
-            lead_id_val = row['lead_id']
-            if pd.notna(lead_id_val) and int(lead_id_val) in lead_id_to_data:
-                # Update this row with data from source files
-                for col in source_columns:
-                    value = lead_id_to_data[int(lead_id_val)][col]
-                    # Convert value to appropriate type if needed
-                    if pd.isna(value):
-                        df_export.at[idx, col] = None
-                    else:
-                        df_export.at[idx, col] = value
-                matched_count += 1
+        # Merge data by updating rows where lead_id matches, one column at a time
+        matched_mask = df_export['lead_id'].isin(source_by_lead_id.index).to_numpy(dtype=bool)
+        matched_rows = source_by_lead_id.loc[df_export.loc[matched_mask, 'lead_id'].astype(int)]
+        for col in source_columns:
+            values = matched_rows[col].astype('object')
+            df_export.loc[matched_mask, col] = values.where(values.notna(), None).to_numpy()
+        matched_count = int(matched_mask.sum())
         
         df_export_updated = df_export
         print(f"Matched and merged data for {matched_count} rows")
@@ -179,11 +167,16 @@ def filter_by_lead_ids():
         except Exception as e:
             print(f"Warning: Could not create backup: {e}")
         
-        # Save updated export file
+        # Save updated export file: write to a temp file and swap it in with
+        # os.replace, so an interrupted write never leaves a truncated export file
+        temp_file = export_file + '.tmp'
         try:
-            df_export_updated.to_csv(export_file, index=False)
+            df_export_updated.to_csv(temp_file, index=False)
+            os.replace(temp_file, export_file)
             print(f"Updated export file saved to: {export_file}")
         except PermissionError:
+            if os.path.exists(temp_file):
+                os.remove(temp_file)
             print(f"\nERROR: Cannot save to {export_file}")
             print("Please close the file if it's open in Excel or another program, then run the script again.")
             if 'backup_file' in locals():
@@ -20,12 +20,12 @@ def merge_lead_data(source_file, vici_file, output_file, description=""):
     print(f"Reading CSV files...")
     
     try:
-        # Read the source file
-        df_source = pd.read_csv(source_file, low_memory=False)
+        # Read the source file (lead id as string so it is not sniffed as int/float)
+        df_source = pd.read_csv(source_file, dtype={'ZC_Lead_ID': str}, low_memory=False)
         print(f"Source file loaded: {len(df_source)} rows")
         
-        # Read the Vici file
-        df_vici = pd.read_csv(vici_file, low_memory=False)
+        # Read the Vici file (lead id as string so it is not sniffed as int/float)
+        df_vici = pd.read_csv(vici_file, dtype={'lead_id': str}, low_memory=False)
         print(f"Vici file loaded: {len(df_vici)} rows")
         
         # Check if required columns exist
@@ -41,36 +41,28 @@ def merge_lead_data(source_file, vici_file, output_file, description=""):
         df_source['ZC_Lead_ID'] = df_source['ZC_Lead_ID'].astype(str)
         df_vici['lead_id'] = df_vici['lead_id'].astype(str)
         
-        # Create a dictionary mapping lead_id to row data from Vici file
         # Get all columns from Vici file except lead_id (to avoid duplicate)
         vici_columns = [col for col in df_vici.columns if col != 'lead_id']
         
-        # Create a mapping dictionary
-        vici_dict = {}
-        for idx, row in df_vici.iterrows():
-            lead_id = str(row['lead_id'])
-            if lead_id not in vici_dict:
-                vici_dict[lead_id] = {}
-                for col in vici_columns:
-                    vici_dict[lead_id][col] = row[col]
+        # Index the Vici rows by lead_id (first occurrence wins) for a vectorized lookup
+        vici_by_lead_id = (
+            df_vici.drop_duplicates(subset=['lead_id'], keep='first')
+            .set_index('lead_id')[vici_columns]
+        )
         
-        print(f"Created mapping for {len(vici_dict)} unique lead_ids")
+        print(f"Created mapping for {len(vici_by_lead_id)} unique lead_ids")
         
         # Add columns from Vici file to source dataframe
         for col in vici_columns:
             if col not in df_source.columns:
                 df_source[col] = None
         
-        # Merge the data
-        matched_count = 0
-        for idx, row in df_source.iterrows():
-            zc_lead_id = str(row['ZC_Lead_ID'])
-            
-            if zc_lead_id in vici_dict:
-                # Update the row with data from Vici file
-                for col in vici_columns:
-                    df_source.at[idx, col] = vici_dict[zc_lead_id][col]
-                matched_count += 1
+        # Merge the data column by column for every row whose ZC_Lead_ID matches
+        matched_mask = df_source['ZC_Lead_ID'].isin(vici_by_lead_id.index).to_numpy(dtype=bool)
+        matched_rows = vici_by_lead_id.loc[df_source.loc[matched_mask, 'ZC_Lead_ID']]
+        for col in vici_columns:
+            df_source.loc[matched_mask, col] = matched_rows[col].to_numpy()
+        matched_count = int(matched_mask.sum())
         
         print(f"Matched {matched_count} rows out of {len(df_source)} total rows")
         